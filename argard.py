@@ -1,15 +1,21 @@
-import json
 import sys
 import time
 import math
 import threading
 import queue
 import configparser
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-
+import bisect
+import functools
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson as _json  # Optional: faster, parses bytes without a decode step
+except ImportError:
+    import json as _json
+
+import urllib3
 from rich import box
 from rich.align import Align
 from rich.console import Console
@@ -21,27 +27,47 @@ from rich.text import Text
 from rich.columns import Columns
 
 # --- API Configuration ---
-config = configparser.ConfigParser()
-config.read('config.ini')
+class Config(NamedTuple):
+    """Settings from config.ini, frozen at import"""
+    station_id: str
+    weather_com_api_key: str
+    openweather_api_key: str
+    latitude: float
+    longitude: float
+    refresh_seconds: int
+
+# config.ini is parsed once here; the parser is dropped and everything below reads CFG
+_parser = configparser.ConfigParser()
+_parser.read('config.ini')
+CFG = Config(
+    station_id=_parser.get('WeatherCom', 'STATION_ID'),
+    weather_com_api_key=_parser.get('WeatherCom', 'API_KEY'),
+    openweather_api_key=_parser.get('OpenWeather', 'API_KEY'),
+    latitude=_parser.getfloat('OpenWeather', 'LATITUDE'),
+    longitude=_parser.getfloat('OpenWeather', 'LONGITUDE'),
+    refresh_seconds=_parser.getint('General', 'REFRESH_SECONDS'),
+)
+del _parser
 
 # Weather.com API
-weather_com_config = config['WeatherCom']
-STATION_ID = weather_com_config.get('STATION_ID')
-WEATHER_COM_API_KEY = weather_com_config.get('API_KEY')
+STATION_ID = CFG.station_id
+WEATHER_COM_API_KEY = CFG.weather_com_api_key
 API_URL = (
     f"https://api.weather.com/v2/pws/observations/current?"
     f"stationId={STATION_ID}&format=json&units=m&apiKey={WEATHER_COM_API_KEY}"
 )
 
 # OpenWeather API
-openweather_config = config['OpenWeather']
-OPENWEATHER_API_KEY = openweather_config.get('API_KEY')
-LATITUDE = openweather_config.getfloat('LATITUDE')
-LONGITUDE = openweather_config.getfloat('LONGITUDE')
-# Updated to use v2.5 forecast endpoint (OneCall 3.0 is deprecated/restricted)
+OPENWEATHER_API_KEY = CFG.openweather_api_key
+LATITUDE = CFG.latitude
+LONGITUDE = CFG.longitude
+# The UI shows at most 12 entries full screen; keep a margin for wide terminals
+FORECAST_ENTRIES = 24
+# Updated to use v2.5 forecast endpoint (OneCall 3.0 is deprecated/restricted).
+# cnt trims the list server-side, so the default 40 entries are never sent or parsed.
 OPENWEATHER_API_URL = (
     f"https://api.openweathermap.org/data/2.5/forecast?"
-    f"lat={LATITUDE}&lon={LONGITUDE}&units=metric&appid={OPENWEATHER_API_KEY}"
+    f"lat={LATITUDE}&lon={LONGITUDE}&units=metric&cnt={FORECAST_ENTRIES}&appid={OPENWEATHER_API_KEY}"
 )
 
 # Open-Meteo Air Quality API (free, no key needed — reuses the same lat/lon)
@@ -52,10 +78,26 @@ AIR_QUALITY_API_URL = (
 )
 
 # General Settings
-general_config = config['General']
-REFRESH_SECONDS = general_config.getint('REFRESH_SECONDS')
+REFRESH_SECONDS = CFG.refresh_seconds
+
+# Poll intervals: the PWS reports on every refresh, the forecast and AQI far less often
+OBSERVATION_TTL = REFRESH_SECONDS
+HOURLY_FORECAST_TTL = max(REFRESH_SECONDS, 600)
+AIR_QUALITY_TTL = max(REFRESH_SECONDS, 600)
+# Ceilings for polling back-off: unchanged PWS readings, and HTTP 429 rate limiting on any endpoint
+OBSERVATION_MAX_INTERVAL = max(REFRESH_SECONDS, 300)
+BACKOFF_MAX_INTERVAL = 3600
 
 # --- Display Mode State ---
+@dataclass(frozen=True)
+class ModeSnapshot:
+    """Immutable copy of DisplayMode taken once per UI tick"""
+    full_forecast: bool
+    mode_changed: bool
+    enable_auto_switch: bool
+    last_switch_time: float
+    auto_switch_interval: int
+
 class DisplayMode:
     def __init__(self):
         self.full_forecast = False
@@ -82,161 +124,277 @@ class DisplayMode:
                     return True
             return False
 
-    def is_full_forecast(self):
-        with self.lock:
-            return self.full_forecast
-
-    def has_mode_changed(self):
-        with self.lock:
-            if self.mode_changed:
-                self.mode_changed = False
-                return True
-            return False
-
-    def clear_mode_change(self):
+    def snapshot(self) -> ModeSnapshot:
+        """Copy the whole state under a single lock acquisition and consume mode_changed"""
         with self.lock:
+            snap = ModeSnapshot(self.full_forecast, self.mode_changed, self.enable_auto_switch,
+                                self.last_switch_time, self.auto_switch_interval)
             self.mode_changed = False
+            return snap
 
 display_mode = DisplayMode()
 
 # --- Data Fetching Functions ---
 
+# One keep-alive pool per API host, shared by every refresh. Transient gateway
+# errors are retried with a short exponential backoff; a final error response is
+# returned rather than raised so it shows up as "HTTP 5xx". Retry-After is ignored:
+# honoring it would also retry 429s and could park the fetcher thread for hours,
+# so rate limiting is left to EndpointSchedule's back-off.
+_http = urllib3.PoolManager(
+    num_pools=3,
+    maxsize=4,
+    timeout=urllib3.Timeout(connect=3, read=7),
+    retries=urllib3.Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    ),
+    # urllib3 transparently decompresses gzip bodies on read
+    headers={"User-Agent": "pws-rich-dashboard/1.0", "Accept": "application/json", "Accept-Encoding": "gzip"},
+)
+
+# PWS responses are ~2 KB and the forecast well under 50 KB; anything bigger is bogus.
+# The cap applies to the decompressed body.
+MAX_PAYLOAD_BYTES = 64 * 1024
+
+# Per URL: (conditional request headers, parsed body) from the last 200 response
+_validators: Dict[str, Tuple[Dict[str, str], Any]] = {}
+
+def _request_json(url: str) -> Tuple[int, Any]:
+    """GET url and return (status, parsed JSON body or None if status != 200).
+    Sends If-None-Match/If-Modified-Since from the last 200, and answers a 304 with
+    that response's body as a 200. The body is read with a hard size cap, raising
+    ValueError when exceeded."""
+    last = _validators.get(url)
+    resp = _http.request("GET", url, headers={**_http.headers, **last[0]} if last else None, preload_content=False)
+    try:
+        if resp.status == 304 and last:
+            return 200, last[1]
+        raw = resp.read(MAX_PAYLOAD_BYTES + 1)
+        if len(raw) > MAX_PAYLOAD_BYTES:
+            resp.close()  # Don't hand a half-read connection back to the pool
+            raise ValueError("Payload too large")
+        if resp.status != 200:
+            return resp.status, None
+        data = _json.loads(raw)
+        etag, modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        conditional = {}
+        if etag: conditional["If-None-Match"] = etag
+        if modified: conditional["If-Modified-Since"] = modified
+        if conditional:
+            _validators[url] = (conditional, data)
+        else:
+            _validators.pop(url, None)
+        return 200, data
+    finally:
+        resp.release_conn()
+
 def fetch_observation() -> Tuple[Dict[str, Any], str]:
-    headers = {"User-Agent": "pws-rich-dashboard/1.0", "Accept": "application/json"}
-    req = Request(API_URL, headers=headers)
     try:
-        with urlopen(req, timeout=10) as resp:
-            if resp.status != 200:
-                return {}, f"HTTP {resp.status}"
-            data = json.loads(resp.read().decode("utf-8"))
-            obs_list = data.get("observations") or []
-            return (obs_list[0], "") if obs_list else ({}, "No observations")
+        status, data = _request_json(API_URL)
+        if status != 200:
+            return {}, f"HTTP {status}"
+        obs_list = data.get("observations") or []
+        return (obs_list[0], "") if obs_list else ({}, "No observations")
     except Exception as e:
         return {}, f"Error: {e}"
 
 def fetch_hourly_forecast() -> Tuple[List[Dict[str, Any]], str]:
-    headers = {"User-Agent": "pws-rich-dashboard/1.0", "Accept": "application/json"}
-    req = Request(OPENWEATHER_API_URL, headers=headers)
     try:
-        with urlopen(req, timeout=10) as resp:
-            if resp.status != 200:
-                return [], f"HTTP {resp.status}"
-            data = json.loads(resp.read().decode("utf-8"))
-
-            # Convert v2.5 forecast format to match the existing code structure
-            # v2.5 returns data in "list" array, while v3.0 OneCall returned "hourly"
-            forecast_list = data.get("list", [])
-
-            # Transform each item to match the expected structure
-            hourly_data = []
-            for item in forecast_list:
-                transformed = {
-                    "dt": item.get("dt"),
-                    "temp": item.get("main", {}).get("temp"),
-                    "feels_like": item.get("main", {}).get("feels_like"),
-                    "weather": item.get("weather", []),
-                    "pop": item.get("pop", 0),  # Probability of precipitation
-                    "wind_speed": item.get("wind", {}).get("speed"),
-                    "wind_deg": item.get("wind", {}).get("deg"),
-                    "clouds": item.get("clouds", {}).get("all"),
-                    "visibility": item.get("visibility"),
-                    "pressure": item.get("main", {}).get("pressure"),
-                    "humidity": item.get("main", {}).get("humidity"),
-                    "rain": item.get("rain", {})  # May contain "3h" key
-                }
-                hourly_data.append(transformed)
-
-            return hourly_data, ""
+        status, data = _request_json(OPENWEATHER_API_URL)
+        if status != 200:
+            return [], f"HTTP {status}"
+
+        # Convert v2.5 forecast format to match the existing code structure
+        # v2.5 returns data in "list" array, while v3.0 OneCall returned "hourly"
+        forecast_list = data.get("list", [])[:FORECAST_ENTRIES]
+
+        # Slim per-hour dicts with only the fields the hour panels render
+        hourly_data = []
+        for item in forecast_list:
+            main = item.get("main", {})
+            wind = item.get("wind", {})
+            weather = item.get("weather") or [{}]
+            hourly_data.append({
+                "dt": item.get("dt"),
+                "temp": main.get("temp"),
+                "weather": [{"icon": weather[0].get("icon"), "description": weather[0].get("description", "")}],
+                "pop": item.get("pop", 0),  # Probability of precipitation
+                "wind_speed": wind.get("speed"),
+                "wind_deg": wind.get("deg"),
+                "clouds": item.get("clouds", {}).get("all"),
+                "visibility": item.get("visibility"),
+                "pressure": main.get("pressure"),
+                "humidity": main.get("humidity"),
+                "rain": item.get("rain", {})  # May contain "3h" key
+            })
+
+        return hourly_data, ""
     except Exception as e:
         return [], f"Error: {e}"
 
 def fetch_air_quality() -> Tuple[Dict[str, Any], str]:
     """Fetch current air quality (US AQI, PM2.5, PM10) from Open-Meteo."""
-    headers = {"User-Agent": "pws-rich-dashboard/1.0", "Accept": "application/json"}
-    req = Request(AIR_QUALITY_API_URL, headers=headers)
     try:
-        with urlopen(req, timeout=10) as resp:
-            if resp.status != 200:
-                return {}, f"AQI HTTP {resp.status}"
-            data = json.loads(resp.read().decode("utf-8"))
-            return data.get("current") or {}, ""
+        status, data = _request_json(AIR_QUALITY_API_URL)
+        if status != 200:
+            return {}, f"AQI HTTP {status}"
+        return data.get("current") or {}, ""
     except Exception as e:
         return {}, f"AQI Error: {e}"
 
+# --- Last Good Responses ---
+
+_cache: Dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+def cached_fetch(url: str, fetch) -> Tuple[Any, str]:
+    """Return fetch() result, remembering the payload for url.
+    On error the last good payload is returned along with the error message."""
+    data, err = fetch()
+    with _cache_lock:
+        if err:
+            return _cache.get(url, data), err
+        _cache[url] = data
+    return data, err
+
+# --- Refresh Scheduling ---
+
+class EndpointSchedule:
+    """Poll timing for one API endpoint. The interval starts at ttl and doubles on HTTP 429
+    (up to rate_limit_max), or while version(data) stays unchanged for two polls (up to
+    max_interval)."""
+    def __init__(self, url, fetch, ttl, max_interval, empty, version=None, rate_limit_max=BACKOFF_MAX_INTERVAL):
+        self.url = url
+        self.fetch = fetch
+        self.ttl = ttl
+        self.interval = ttl
+        self.max_interval = max_interval
+        self.rate_limit_max = rate_limit_max
+        self.version = version
+        self.last_version = None
+        self.unchanged = 0
+        self.next_fetch_at = 0.0  # time.monotonic() deadline; 0 = due now
+        self.result = (empty, "")
+
+    def run(self):
+        return cached_fetch(self.url, self.fetch)
+
+    def update(self, result):
+        data, err = result
+        if data == self.result[0]:
+            # Keep the old object so identity-keyed panel/frame caches still hit
+            data = self.result[0]
+        self.result = (data, err)
+        if err.endswith("HTTP 429"):
+            self.interval = min(self.interval * 2, self.rate_limit_max)
+        elif not err:
+            version = self.version(data) if self.version else None
+            self.unchanged = self.unchanged + 1 if version is not None and version == self.last_version else 0
+            self.last_version = version
+            self.interval = min(self.interval * 2, self.max_interval) if self.unchanged >= 2 else self.ttl
+        # Scheduled from completion, so a slow fetch never triggers an immediate re-poll
+        self.next_fetch_at = time.monotonic() + self.interval
+
+_endpoints = (
+    EndpointSchedule(API_URL, fetch_observation, OBSERVATION_TTL, OBSERVATION_MAX_INTERVAL, {},
+                     version=lambda obs: obs.get("obsTimeEpoch")),
+    EndpointSchedule(OPENWEATHER_API_URL, fetch_hourly_forecast, HOURLY_FORECAST_TTL, BACKOFF_MAX_INTERVAL, []),
+    EndpointSchedule(AIR_QUALITY_API_URL, fetch_air_quality, AIR_QUALITY_TTL, BACKOFF_MAX_INTERVAL, {}),
+)
+
+def _fetch_into(results: Dict[int, Tuple[Any, str]], i: int, ep: EndpointSchedule) -> None:
+    results[i] = ep.run()
+
+def refresh_due() -> bool:
+    """Fetch every endpoint whose next poll time has passed, in parallel.
+    Returns True if anything was fetched."""
+    now = time.monotonic()
+    due = [ep for ep in _endpoints if now >= ep.next_fetch_at]
+    # One daemon thread per fetch: a request stuck in retries/timeouts must never
+    # hold up interpreter exit the way a pool's joined worker threads would
+    results: Dict[int, Tuple[Any, str]] = {}
+    threads = [threading.Thread(target=_fetch_into, args=(results, i, ep), name=f"fetch-{i}", daemon=True)
+               for i, ep in enumerate(due)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    for i, ep in enumerate(due):
+        ep.update(results[i])
+    return bool(due)
+
+def data_snapshot() -> Tuple[Tuple[Dict[str, Any], str], Tuple[List[Dict[str, Any]], str], Tuple[Dict[str, Any], str]]:
+    """Latest (data, error) of observation, hourly forecast and air quality"""
+    return tuple(ep.result for ep in _endpoints)
+
 # --- Helper Functions ---
 
+_COMPASS = ("N","NNE","NE","ENE","E","ESE","SE","SSE","S","SSW","SW","WSW","W","WNW","NW","NNW")
+_ARROWS = ("↑","↗","→","↘","↓","↙","←","↖")
+_NA = ("🤷 N/A", "dim")
+# Per whole degree lookups; wind directions arrive as integer degrees
+_COMPASS_TABLE = tuple(_COMPASS[int((d+11.25)//22.5)%16] for d in range(360))
+_ARROW_TABLE = tuple(_ARROWS[int((d+22.5)//45)%8] for d in range(360))
+
+# Classifier thresholds with one more result than threshold (last = above the top bound)
+_FEELING_THRESH = (20, 28, 35, 40)
+_FEELING_OUT = (("🥶 Cool", "cyan"), ("😌 Comfortable", "green"), ("😊 Warm", "yellow"),
+                ("🔥 Very Hot", "red"), ("🥵 Dangerously Hot", "bold red"))
+_WIND_THRESH = (2, 12, 29, 50, 75, 103)
+_WIND_OUT = (("🧘 Calm", "dim"), ("🍃 Light", "green"), ("💨 Moderate", "yellow"), ("🌬️ Strong", "orange3"),
+             ("🌪️ Gale", "red"), ("⛈️ Storm", "bold red"), ("🌀 Hurricane", "bold magenta"))
+_RAIN_NONE = ("☀️ No Rain", "dim")
+_RAIN_THRESH = (2.5, 10, 50)
+_RAIN_OUT = (("💧 Light", "green"), ("🌧️  Moderate", "yellow"), ("⛈️   Heavy", "red"), ("🌊 Violent", "bold magenta"))
+_UV_THRESH = (2, 5, 7, 10)  # Upper bounds are inclusive
+_UV_OUT = (("😊 Low", "green"), ("😎 Moderate", "yellow"), ("😮 High", "orange3"),
+           ("🥵 Very High", "red"), ("😱 Extreme", "bold magenta"))
+_AQI_THRESH = (50, 100, 150, 200, 300)  # Upper bounds are inclusive
+_AQI_OUT = (("😊", "Good", "green"), ("😐", "Moderate", "yellow"), ("😮", "Unhealthy (Sensitive)", "orange3"),
+            ("😷", "Unhealthy", "red"), ("🤢", "Very Unhealthy", "bold magenta"), ("☠️ ", "Hazardous", "bold red"))
+_SOLAR_THRESH = (50, 150, 350, 600, 850)  # Upper bounds are inclusive
+_SOLAR_OUT = (("🌑 มืด", "dim"), ("🌤️ แสงอ่อน", "cyan"), ("☀️ แสงปานกลาง", "green"),
+              ("🔆 แสงจัด", "yellow"), ("🔥 แสงแรง", "orange3"), ("💥 แสงรุนแรง", "bold red"))
+_GAUGE_THRESH = (0.15, 0.35, 0.55, 0.70, 0.85)
+_GAUGE_COLORS = ("dim", "cyan", "green", "yellow", "orange3", "red")
+
 def ms_to_kmh(v): return round(float(v) * 3.6, 1) if isinstance(v, (int, float)) else v
 def deg_to_compass(deg):
-    try: d = float(deg) % 360
+    try: return _COMPASS_TABLE[int(float(deg)) % 360]
     except: return "-"
-    return ["N","NNE","NE","ENE","E","ESE","SE","SSE","S","SSW","SW","WSW","W","WNW","NW","NNW"][int((d+11.25)//22.5)%16]
 def deg_to_arrow(deg):
-    try: d = float(deg) % 360
+    try: return _ARROW_TABLE[int(float(deg)) % 360]
     except: return "?"
-    return ["↑","↗","→","↘","↓","↙","←","↖"][int((d+22.5)//45)%8]
-def get_feeling_level(t):
-    try:
-        t = float(t)
-        if t >= 40: return "🥵 Dangerously Hot", "bold red"
-        if t >= 35: return "🔥 Very Hot", "red"
-        if t >= 28: return "😊 Warm", "yellow"
-        if t >= 20: return "😌 Comfortable", "green"
-        return "🥶 Cool", "cyan"
-    except: return "🤷 N/A", "dim"
-def get_wind_description(s):
-    try:
-        s = float(s)
-        if s < 2: return "🧘 Calm", "dim"
-        if s < 12: return "🍃 Light", "green"
-        if s < 29: return "💨 Moderate", "yellow"
-        if s < 50: return "🌬️ Strong", "orange3"
-        if s < 75: return "🌪️ Gale", "red"
-        if s < 103: return "⛈️ Storm", "bold red"
-        return "🌀 Hurricane", "bold magenta"
-    except: return "🤷 N/A", "dim"
-def get_rain_description(r):
-    try:
-        r = float(r)
-        if r == 0: return "☀️ No Rain", "dim"
-        if r < 2.5: return "💧 Light", "green"
-        if r < 10: return "🌧️  Moderate", "yellow"
-        if r < 50: return "⛈️   Heavy", "red"
-        return "🌊 Violent", "bold magenta"
-    except: return "🤷 N/A", "dim"
-def get_uv_description(u):
-    try:
-        u = float(u)
-        if u <= 2: return "😊 Low", "green"
-        if u <= 5: return "😎 Moderate", "yellow"
-        if u <= 7: return "😮 High", "orange3"
-        if u <= 10: return "🥵 Very High", "red"
-        return "😱 Extreme", "bold magenta"
-    except: return "🤷 N/A", "dim"
+def _float_memo(fn):
+    """Memoize a classifier of one float. The argument is converted first, so unhashable
+    or non-numeric readings still get _NA and equal values (25, 25.0, "25") share an entry."""
+    classify = functools.lru_cache(maxsize=512)(fn)
+    @functools.wraps(fn)
+    def wrapper(v):
+        try: v = float(v)
+        except: return _NA
+        return classify(v)
+    return wrapper
+@_float_memo
+def get_feeling_level(t): return _FEELING_OUT[bisect.bisect_right(_FEELING_THRESH, t)]
+@_float_memo
+def get_wind_description(s): return _WIND_OUT[bisect.bisect_right(_WIND_THRESH, s)]
+@_float_memo
+def get_rain_description(r): return _RAIN_NONE if r == 0 else _RAIN_OUT[bisect.bisect_right(_RAIN_THRESH, r)]
+@_float_memo
+def get_uv_description(u): return _UV_OUT[bisect.bisect_left(_UV_THRESH, u)]
 
 def get_aqi_description(aqi):
     """Return (emoji, category, style) for US AQI (US EPA standard, same scale AirVisual uses)."""
-    try:
-        aqi = float(aqi)
-    except:
-        return "🤷", "N/A", "dim"
-    if aqi <= 50:  return "😊", "Good", "green"
-    if aqi <= 100: return "😐", "Moderate", "yellow"
-    if aqi <= 150: return "😮", "Unhealthy (Sensitive)", "orange3"
-    if aqi <= 200: return "😷", "Unhealthy", "red"
-    if aqi <= 300: return "🤢", "Very Unhealthy", "bold magenta"
-    return "☠️ ", "Hazardous", "bold red"
+    try: return _AQI_OUT[bisect.bisect_left(_AQI_THRESH, float(aqi))]
+    except: return "🤷", "N/A", "dim"
 
 def get_solar_description(s):
     """Return (description, style) for solar radiation in W/m²."""
-    try:
-        s = float(s)
-        if s <= 50:   return "🌑 มืด", "dim"
-        if s <= 150:  return "🌤️ แสงอ่อน", "cyan"
-        if s <= 350:  return "☀️ แสงปานกลาง", "green"
-        if s <= 600:  return "🔆 แสงจัด", "yellow"
-        if s <= 850:  return "🔥 แสงแรง", "orange3"
-        return "💥 แสงรุนแรง", "bold red"
-    except: return "🤷 N/A", "dim"
+    try: return _SOLAR_OUT[bisect.bisect_left(_SOLAR_THRESH, float(s))]
+    except: return _NA
 
 def make_solar_gauge(s, width=20):
     """Return a visual gauge bar string for solar radiation (0–1200 W/m²)."""
@@ -247,42 +405,101 @@ def make_solar_gauge(s, width=20):
         filled = int(ratio * width)
         empty = width - filled
         # Color based on level
-        if ratio < 0.15:   color = "dim"
-        elif ratio < 0.35: color = "cyan"
-        elif ratio < 0.55: color = "green"
-        elif ratio < 0.70: color = "yellow"
-        elif ratio < 0.85: color = "orange3"
-        else:              color = "red"
+        color = _GAUGE_COLORS[bisect.bisect_right(_GAUGE_THRESH, ratio)]
         return f"[{color}]{'█' * filled}{'░' * empty}[/]"
     except:
         return f"[dim]{'░' * width}[/]"
-def get_weather_emoji(icon):
-    if "01" in icon: return "☀️" if "d" in icon else "🌙"
-    if "02" in icon: return "🌤️" if "d" in icon else "☁️"
-    if "03" in icon or "04" in icon: return "☁️"
-    if "09" in icon or "10" in icon: return "🌧️"
-    if "11" in icon: return "⛈️"
-    if "13" in icon: return "❄️"
-    if "50" in icon: return "🌫️"
-    return "❓"
+
+# OpenWeather icon codes are two digits plus d(ay)/n(ight)
+_WEATHER_EMOJI = {
+    "01d": "☀️", "01n": "🌙", "02d": "🌤️", "02n": "☁️",
+    "03d": "☁️", "03n": "☁️", "04d": "☁️", "04n": "☁️",
+    "09d": "🌧️", "09n": "🌧️", "10d": "🌧️", "10n": "🌧️",
+    "11d": "⛈️", "11n": "⛈️", "13d": "❄️", "13n": "❄️",
+    "50d": "🌫️", "50n": "🌫️",
+}
+def get_weather_emoji(icon): return _WEATHER_EMOJI.get(icon, "❓")
+
+# --- Panel Cache ---
+
+# Last Panel built by each panel function: (obs, args, key, panel)
+_panel_cache: Dict[str, Tuple[Dict[str, Any], tuple, tuple, Panel]] = {}
+
+def _obs_field(obs, path):
+    """Look up a dotted path such as "metric.temp" in the observation dict."""
+    value = obs
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def panel_cache(*keys):
+    """Reuse the previously built Panel while the obs fields in keys (and any extra
+    arguments) are unchanged."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(obs, *args):
+            cached = _panel_cache.get(fn.__name__)
+            # Snapshots are replaced, never mutated: the same dicts mean the same inputs
+            if cached and cached[0] is obs and cached[1] == args:
+                return cached[3]
+            key = tuple(_obs_field(obs, k) for k in keys) + args
+            if cached and cached[2] == key:
+                panel = cached[3]
+            else:
+                panel = fn(obs, *args)
+            _panel_cache[fn.__name__] = (obs, args, key, panel)
+            return panel
+        return wrapper
+    return decorator
+
+# Sun/moon panels only change with the calendar, or if the station moves
+_daily_cache: Dict[str, Tuple[tuple, Panel]] = {}
+
+def _round_coord(v):
+    return round(v, 2) if isinstance(v, (int, float)) else v
+
+def _calendar_panel_cache(period):
+    """Reuse the Panel built earlier in the same period(now) for the same (rounded) station location."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(obs, now):
+            key = (period(now), _round_coord(obs.get("lat")), _round_coord(obs.get("lon")))
+            cached = _daily_cache.get(fn.__name__)
+            if cached and cached[0] == key:
+                return cached[1]
+            panel = fn(obs, now)
+            _daily_cache[fn.__name__] = (key, panel)
+            return panel
+        return wrapper
+    return decorator
+
+daily_panel_cache = _calendar_panel_cache(lambda now: now.date())
+hourly_panel_cache = _calendar_panel_cache(lambda now: (now.date(), now.hour))
 
 # --- Panel Creation Functions ---
 
-def header_panel(obs, error): # (Restored)
+# The header shows the clock, so only its text is rebuilt on each call
+_header = Panel(
+    Text(""),
+    style="bold",
+    box=box.SIMPLE,
+    padding=(0, 1),
+    subtitle="v1.2.0",
+    subtitle_align="right"
+)
+
+def header_panel(obs, error, now_ts): # (Restored)
     station = obs.get("stationID", "-")
     obs_time = obs.get("obsTimeLocal") or obs.get("obsTimeUtc") or "-"
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now_ts))
     status = f"🌤️ Station: {station} | 📅 Obs: {obs_time} | 🕐 Now: {now_str}"
     if error: status += f"  •  [bold red]❌ Error:[/] {error}"
-    return Panel(
-        Text(status, justify="center"),
-        style="bold",
-        box=box.SIMPLE,
-        padding=(0, 1),
-        subtitle="v1.2.0",
-        subtitle_align="right"
-    )
+    _header.renderable = Text(status, justify="center")
+    return _header
 
+@panel_cache("metric.temp", "metric.heatIndex", "metric.dewpt", "metric.windChill")
 def thermal_panel(obs): # (Restored)
     m = obs.get("metric") or {}
     temp, heat_index, dew, chill = m.get("temp","-"), m.get("heatIndex","-"), m.get("dewpt","-"), m.get("windChill","-")
@@ -295,6 +512,7 @@ def thermal_panel(obs): # (Restored)
     grid.add_row("❄️  Wind chill", f"{chill} °C")
     return Panel(Align.center(grid), title="🌡️  Thermal Comfort", box=box.ROUNDED, padding=(0, 1))
 
+@panel_cache("metric.windSpeed", "metric.windGust", "winddir")
 def wind_panel(obs): # (Restored)
     m = obs.get("metric") or {}
     speed_kmh = ms_to_kmh(m.get("windSpeed", "-"))
@@ -309,6 +527,7 @@ def wind_panel(obs): # (Restored)
     grid.add_row("Desc:", Text(desc, style=style))
     return Panel(Align.center(grid), title="💨 Wind | Gust", box=box.ROUNDED, padding=(0, 1))
 
+@panel_cache("metric.precipRate", "metric.precipTotal")
 def rain_panel(obs): # (Restored)
     m = obs.get("metric") or {}
     rate, total = m.get("precipRate", "-"), m.get("precipTotal", "-")
@@ -319,6 +538,7 @@ def rain_panel(obs): # (Restored)
     grid.add_row("📅 Today:", f"{total} mm")
     return Panel(Align.center(grid), title="🌧️  Rainfall", box=box.ROUNDED, padding=(0, 1))
 
+@panel_cache("uv", "solarRadiation")
 def solar_panel(obs): # (Restored)
     uv, solar = obs.get("uv", "-"), obs.get("solarRadiation", "-")
     uv_desc, uv_style = get_uv_description(uv)
@@ -333,6 +553,7 @@ def solar_panel(obs): # (Restored)
     grid.add_row("  🔆 Intensity:", Text.from_markup(f"[{solar_style}]{solar_desc}[/]  {gauge}"))
     return Panel(Align.center(grid), title="☀️  Solar • UV", box=box.ROUNDED, padding=(0, 1))
 
+@panel_cache("humidity")
 def humidity_panel(obs): # (Restored)
     humid = obs.get("humidity", "-")
     display = Text(f"💧 {humid}%", justify="center")
@@ -343,6 +564,7 @@ def humidity_panel(obs): # (Restored)
     except: pass
     return Panel(Align.center(display), title="💧 Humidity", subtitle="Relative", box=box.ROUNDED, padding=(0, 1))
 
+@panel_cache("metric.pressure")
 def barometer_panel(obs, aq=None): # Barometer + Air Quality (US AQI)
     pressure = obs.get("metric", {}).get("pressure", "-")
     us_aqi = (aq or {}).get("us_aqi", "-")
@@ -400,17 +622,55 @@ def get_season_info(day_of_year: int, year: int) -> Tuple[str, str, int, int, st
         days_until = days_in_year - day_of_year + 79
         return "Winter", "❄️ ", days_in, days_until, "Spring 🌸"
 
-def sun_panel(obs): # Updated with Season info
-    lat, lon = obs.get("lat"), obs.get("lon")
-    if lat is None or lon is None: return Panel("No location data", title="☀️ Sun Rise/Set")
+# --- Sun & Moon Calculations ---
+
+# Reference New Moon: January 6, 2000, 18:14 UTC
+# We use a known reference point to calculate the phase accurately
+REF_NEW_MOON = datetime(2000, 1, 6, 18, 14)
+SYNODIC_MONTH = 29.53058867
+
+# Moon phase by eighth of the synodic month, starting at New Moon
+_MOON_TABLE = (
+    ("🌑", "New Moon"), ("🌒", "Waxing Crescent"), ("🌓", "First Quarter"), ("🌔", "Waxing Gibbous"),
+    ("🌕", "Full Moon"), ("🌖", "Waning Gibbous"), ("🌗", "Last Quarter"), ("🌘", "Waning Crescent"),
+)
+
+class SunTimes(NamedTuple):
+    sunrise: float  # Hours after local midnight
+    sunset: float
+
+class MoonPhase(NamedTuple):
+    phase: float    # 0.0 (new) .. 1.0
+    emoji: str
+    name: str
+
+# Both depend only on the calendar (and latitude), so each day/hour is computed once
+@functools.lru_cache(maxsize=8)
+def _sun_times(ordinal: int, lat: float) -> SunTimes:
+    """Sunrise/sunset for a date ordinal; called with lat rounded to 2 decimals."""
     # Simplified calculation
-    now = datetime.now()
-    day_of_year = now.timetuple().tm_yday
-    year = now.year
+    day_of_year = date.fromordinal(ordinal).timetuple().tm_yday
     declination = 23.45 * math.sin(math.radians(360/365 * (day_of_year - 80)))
     hour_angle = math.degrees(math.acos(-math.tan(math.radians(lat)) * math.tan(math.radians(declination))))
-    sunrise = 12 - hour_angle / 15
-    sunset = 12 + hour_angle / 15
+    return SunTimes(12 - hour_angle / 15, 12 + hour_angle / 15)
+
+@functools.lru_cache(maxsize=8)
+def _moon_phase(ordinal: int, hour: int) -> MoonPhase:
+    """Moon phase at the start of the given hour of a date ordinal."""
+    day = date.fromordinal(ordinal)
+    # Phase (0.0 to 0.999...)
+    days_passed = (datetime(day.year, day.month, day.day, hour) - REF_NEW_MOON).total_seconds() / 86400
+    phase = (days_passed / SYNODIC_MONTH) % 1
+    return MoonPhase(phase, *_MOON_TABLE[int(phase * 8 + 0.5) % 8])
+
+@daily_panel_cache
+def sun_panel(obs, now): # Updated with Season info
+    lat, lon = obs.get("lat"), obs.get("lon")
+    if lat is None or lon is None: return Panel("No location data", title="☀️ Sun Rise/Set")
+    today = now.date()
+    day_of_year = today.timetuple().tm_yday
+    year = today.year
+    sunrise, sunset = _sun_times(today.toordinal(), round(lat, 2))
     daylight = sunset - sunrise
 
     # Get season info
@@ -452,36 +712,14 @@ def get_thai_lunar_info(phase):
         
     return desc, is_wan_phra
 
-def moon_phase_panel(obs): # (Restored)
+@hourly_panel_cache
+def moon_phase_panel(obs, now): # (Restored)
     """Display current moon phase based on known reference date"""
-    now = datetime.now()
-    
-    # Reference New Moon: January 6, 2000, 18:14 UTC
-    # We use a known reference point to calculate the phase accurately
-    ref_new_moon = datetime(2000, 1, 6, 18, 14)
-    synodic_month = 29.53058867
-    
-    # Calculate time difference
-    diff = now - ref_new_moon
-    days_passed = diff.total_seconds() / 86400
-    
-    # Calculate phase (0.0 to 0.999...)
-    lunations = days_passed / synodic_month
-    phase = lunations % 1
-    
-    is_new_moon, is_full_moon = False, False
-
-    if phase < 0.0625: moon_emoji, phase_name, is_new_moon = "🌑", "New Moon", True
-    elif phase < 0.1875: moon_emoji, phase_name = "🌒", "Waxing Crescent"
-    elif phase < 0.3125: moon_emoji, phase_name = "🌓", "First Quarter"
-    elif phase < 0.4375: moon_emoji, phase_name = "🌔", "Waxing Gibbous"
-    elif phase < 0.5625: moon_emoji, phase_name, is_full_moon = "🌕", "Full Moon", True
-    elif phase < 0.6875: moon_emoji, phase_name = "🌖", "Waning Gibbous"
-    elif phase < 0.8125: moon_emoji, phase_name = "🌗", "Last Quarter"
-    else: moon_emoji, phase_name = "🌘", "Waning Crescent"
-    
-    days_since_new = phase * synodic_month
-    days_until_new = synodic_month - days_since_new
+    phase, moon_emoji, phase_name = _moon_phase(now.toordinal(), now.hour)
+    is_new_moon, is_full_moon = phase_name == "New Moon", phase_name == "Full Moon"
+
+    days_since_new = phase * SYNODIC_MONTH
+    days_until_new = SYNODIC_MONTH - days_since_new
     next_new_moon = now + timedelta(days=days_until_new)
     
     # Thai Lunar Info
@@ -515,105 +753,176 @@ def moon_phase_panel(obs): # (Restored)
     )
 
 
+# Static label column of the hourly panels, parsed into Text once
+_HOUR_LABELS = {
+    "temp": Text("🌡️  Temp:"),
+    "humid": Text("💧 Humid:"),
+    "clouds": Text("☁️  Clouds:"),
+    "wind": Text("💨 Wind:"),
+    "vis": Text("👁️  Vis:"),
+    "pressure": Text(" barometer:"),
+    "precip": Text("💧 Precip:"),
+    "rain": Text("🌧️  Rain:"),
+}
+
+def _make_hour_grid() -> Table:
+    grid = Table.grid(expand=True)
+    grid.add_column(width=10); grid.add_column()
+    return grid
+
+def hour_forecast_panel(hour: Dict[str, Any]) -> Panel:
+    time_str = time.strftime("%H:%M", time.localtime(hour["dt"]))
+    temp = f"{hour['temp']:.1f}°C"
+    weather_desc = hour["weather"][0]["description"].title()
+    weather_icon = get_weather_emoji(hour["weather"][0]["icon"])
+    pop = f"{hour.get('pop', 0) * 100:.0f}%"
+    wind_speed_kmh = ms_to_kmh(hour.get("wind_speed", "-"))
+    wind_arrow = deg_to_arrow(hour.get("wind_deg", "-"))
+    clouds = f"{hour.get('clouds', '-')} %"
+    visibility_km = f"{hour.get('visibility', 0) / 1000:.1f} km"
+    pressure = f"{hour.get('pressure', '-')} hPa"
+    humidity = f"{hour.get('humidity', '-')} %"
+
+    # Labels and values are already Text, so the grid never parses markup per row
+    labels = _HOUR_LABELS
+    grid = _make_hour_grid()
+    grid.add_row(labels["temp"], Text(temp, "green"))
+    grid.add_row(labels["humid"], Text(humidity, "cyan"))
+    grid.add_row(labels["clouds"], Text(clouds, "grey70"))
+    grid.add_row(labels["wind"], Text(f"{wind_arrow} {wind_speed_kmh} km/h", "orange3"))
+    grid.add_row(labels["vis"], Text(visibility_km, "white"))
+    grid.add_row(labels["pressure"], Text(pressure, "bright_green"))
+    grid.add_row(labels["precip"], Text(pop, "blue"))
+    if 'rain' in hour and '1h' in hour['rain']:
+        grid.add_row(labels["rain"], Text(f"{hour['rain']['1h']:.2f} mm", "cyan"))
+    grid.add_row(Text(weather_icon, "white"), Text(weather_desc, "white"))
+    return Panel(grid, title=f"[magenta]{time_str}[/]", box=box.ROUNDED, expand=True)
+
+# Built forecast Panels by timestamp, with the hour dict they were built from.
+# A new fetch yields new dicts, so identity tells whether a Panel is still current.
+_forecast_panel_cache: Dict[int, Tuple[Dict[str, Any], Panel]] = {}
+
 def create_hourly_forecast_panels(hourly_data: List[Dict[str, Any]]) -> Columns:
     panels = []
     for hour in hourly_data:
-        time_str = datetime.fromtimestamp(hour["dt"]).strftime("%H:%M")
-        temp = f"{hour['temp']:.1f}°C"
-        weather_desc = hour["weather"][0]["description"].title()
-        weather_icon = get_weather_emoji(hour["weather"][0]["icon"])
-        pop = f"{hour.get('pop', 0) * 100:.0f}%"
-        wind_speed_kmh = ms_to_kmh(hour.get("wind_speed", "-"))
-        wind_arrow = deg_to_arrow(hour.get("wind_deg", "-"))
-        clouds = f"{hour.get('clouds', '-')} %"
-        visibility_km = f"{hour.get('visibility', 0) / 1000:.1f} km"
-        pressure = f"{hour.get('pressure', '-')} hPa"
-        humidity = f"{hour.get('humidity', '-')} %"
-
-        grid = Table.grid(expand=True)
-        grid.add_column(width=10); grid.add_column()
-        grid.add_row("🌡️  Temp:", f"[green]{temp}[/]")
-        grid.add_row("💧 Humid:", f"[cyan]{humidity}[/]")
-        grid.add_row("☁️  Clouds:", f"[grey70]{clouds}[/]")
-        grid.add_row("💨 Wind:", f"[orange3]{wind_arrow} {wind_speed_kmh} km/h[/]")
-        grid.add_row("👁️  Vis:", f"[white]{visibility_km}[/]")
-        grid.add_row(" barometer:", f"[bright_green]{pressure}[/]")
-        grid.add_row("💧 Precip:", f"[blue]{pop}[/]")
-        if 'rain' in hour and '1h' in hour['rain']:
-            grid.add_row("🌧️  Rain:", f"[cyan]{hour['rain']['1h']:.2f} mm[/]")
-        grid.add_row(f"[white]{weather_icon}[/]", f"[white]{weather_desc}[/]")
-        panels.append(Panel(grid, title=f"[magenta]{time_str}[/]", box=box.ROUNDED, expand=True))
+        cached = _forecast_panel_cache.get(hour["dt"])
+        if cached and cached[0] is hour:
+            panels.append(cached[1])
+            continue
+        panel = hour_forecast_panel(hour)
+        _forecast_panel_cache[hour["dt"]] = (hour, panel)
+        panels.append(panel)
+
+    # Forget hours that have dropped off the front of the forecast
+    if hourly_data:
+        for dt in [dt for dt in _forecast_panel_cache if dt < hourly_data[0]["dt"]]:
+            del _forecast_panel_cache[dt]
     return Columns(panels, equal=True, expand=True)
 
-# --- Full Screen Forecast Layout ---
+# --- Layout Trees ---
+# Both screens keep their split tree for the whole session; each frame only swaps leaf contents
 
-def build_full_forecast_layout(hourly_data: List[Dict[str, Any]]) -> Layout:
-    """Create a full-screen layout showing only the hourly forecast (next 12 hours from current time)"""
-    layout = Layout(name="root")
+def init_layouts() -> Tuple[Layout, Layout]:
+    """Build the (normal, full forecast) layout trees with a named leaf per panel"""
+    main = Layout(name="root")
+    main.split(Layout(name="header", size=3), Layout(name="body", ratio=1), Layout(name="forecast", size=12), Layout(name="footer", size=1))
+    main["body"].split(Layout(name="row1", ratio=1), Layout(name="row2", ratio=1), Layout(name="row3", ratio=1))
+    main["row1"].split_row(Layout(name="thermal"), Layout(name="rain"))
+    main["row2"].split_row(Layout(name="humidity"), Layout(name="wind"), Layout(name="solar"))
+    main["row3"].split_row(Layout(name="barometer"), Layout(name="moon"), Layout(name="sun"))
 
-    # Header
+    full = Layout(name="root")
+    full.split(
+        Layout(name="header", size=3),
+        Layout(name="forecast", ratio=1),
+        Layout(name="footer", size=3)
+    )
     header_text = Text("🌤️ HOURLY FORECAST (NEXT 12 HOURS)", justify="center", style="bold blue")
-    header_panel = Panel(header_text, box=box.HEAVY_HEAD, padding=(0, 1))
+    full["header"].update(Panel(header_text, box=box.HEAVY_HEAD, padding=(0, 1)))
+    return main, full
 
-    # Show next 12 hours from current time
-    forecast_hours = hourly_data[:12]  # First 12 hours from current time
-    forecast_columns = create_hourly_forecast_panels(forecast_hours)
+_main_layout, _full_layout = init_layouts()
 
-    # Main forecast panel
-    forecast_panel = Panel(
-        forecast_columns,
-        title="",
-        box=box.ROUNDED,
-        expand=True,
-        padding=(1, 1)
-    )
+# --- Full Screen Forecast Layout ---
+
+def build_full_forecast_layout(hourly_data: List[Dict[str, Any]], mode: ModeSnapshot, now_ts: float, unchanged: bool = False) -> Layout:
+    """Fill the full-screen layout showing only the hourly forecast (next 12 hours from current time)"""
+    layout = _full_layout
+
+    if not unchanged:
+        # Show next 12 hours from current time
+        forecast_hours = hourly_data[:12]  # First 12 hours from current time
+        forecast_columns = create_hourly_forecast_panels(forecast_hours)
+
+        # Main forecast panel
+        layout["forecast"].update(Panel(
+            forecast_columns,
+            title="",
+            box=box.ROUNDED,
+            expand=True,
+            padding=(1, 1)
+        ))
 
     # Footer
-    if display_mode.enable_auto_switch:
-        time_until_switch = display_mode.auto_switch_interval - (time.time() - display_mode.last_switch_time)
+    if mode.enable_auto_switch:
+        time_until_switch = mode.auto_switch_interval - (now_ts - mode.last_switch_time)
         footer_text = Text(f"⌨️ Auto-switch in {int(time_until_switch)}s • Ctrl+C to quit", justify="center", style="yellow")
     else:
         footer_text = Text("⌨️ Enter key: return to main • Ctrl+C: quit", justify="center", style="yellow")
     footer_panel = Panel(footer_text, box=box.SIMPLE, padding=(0, 1))
 
-    # Layout structure
-    layout.split(
-        Layout(name="header", size=3),
-        Layout(name="forecast", ratio=1),
-        Layout(name="footer", size=3)
-    )
-
-    layout["header"].update(header_panel)
-    layout["forecast"].update(forecast_panel)
     layout["footer"].update(footer_panel)
 
     return layout
 
 # --- Main Layout ---
 
-def build_layout(obs: Dict[str, Any], error: str, hourly_data: List[Dict[str, Any]], console: Console, aq: Dict[str, Any] = None) -> Layout:
+# Inputs of the previous frame; while they are unchanged only the clock-driven parts are redrawn
+_last_frame: Optional[tuple] = None
+
+def _frame_unchanged(frame: tuple) -> bool:
+    """Compare screen/size/error by value and the data payloads by identity"""
+    last = _last_frame
+    return last is not None and frame[:3] == last[:3] and all(a is b for a, b in zip(frame[3:], last[3:]))
+
+def build_layout(mode: ModeSnapshot, obs: Dict[str, Any], error: str, hourly_data: List[Dict[str, Any]], console: Console, aq: Dict[str, Any] = None) -> Layout:
+    # One clock read per frame, shared by every panel that shows or depends on the time
+    now_ts = time.time()
+    now = datetime.fromtimestamp(now_ts)
+
+    global _last_frame
+    frame = (mode.full_forecast, console.width, error, obs, hourly_data, aq)
+    unchanged = _frame_unchanged(frame)
+    _last_frame = frame
+
     # Check if we're in full forecast mode
-    if display_mode.is_full_forecast():
-        return build_full_forecast_layout(hourly_data)
+    if mode.full_forecast:
+        return build_full_forecast_layout(hourly_data, mode, now_ts, unchanged)
 
     # Normal mode layout
-    layout = Layout(name="root")
-    layout.split(Layout(name="header", size=3), Layout(name="body", ratio=1), Layout(name="forecast", size=12), Layout(name="footer", size=1))
-    layout["body"].split(Layout(name="row1", ratio=1), Layout(name="row2", ratio=1), Layout(name="row3", ratio=1))
-    layout["row1"].split_row(thermal_panel(obs), rain_panel(obs))
-    layout["row2"].split_row(humidity_panel(obs), wind_panel(obs), solar_panel(obs))
-    layout["row3"].split_row(barometer_panel(obs, aq), moon_phase_panel(obs), sun_panel(obs))
-    layout["header"].update(header_panel(obs, error))
-
-    panel_width = 35
-    num_panels = console.width // panel_width
-    sliced_data = hourly_data[:num_panels]
-    forecast_columns = create_hourly_forecast_panels(sliced_data)
-    layout["forecast"].update(Panel(forecast_columns, title="[bold]Hourly Forecast[/bold]", box=box.HEAVY_HEAD, expand=True))
+    layout = _main_layout
+    if not unchanged:
+        layout["thermal"].update(thermal_panel(obs))
+        layout["rain"].update(rain_panel(obs))
+        layout["humidity"].update(humidity_panel(obs))
+        layout["wind"].update(wind_panel(obs))
+        layout["solar"].update(solar_panel(obs))
+        layout["barometer"].update(barometer_panel(obs, aq))
+
+        panel_width = 35
+        num_panels = console.width // panel_width
+        sliced_data = hourly_data[:num_panels]
+        forecast_columns = create_hourly_forecast_panels(sliced_data)
+        layout["forecast"].update(Panel(forecast_columns, title="[bold]Hourly Forecast[/bold]", box=box.HEAVY_HEAD, expand=True))
+
+    # Calendar panels are cached per day/hour, so these are lookups except at the boundary
+    layout["moon"].update(moon_phase_panel(obs, now))
+    layout["sun"].update(sun_panel(obs, now))
+    layout["header"].update(header_panel(obs, error, now_ts))
 
       # Show auto-switch status
-    if display_mode.enable_auto_switch:
-        time_until_switch = display_mode.auto_switch_interval - (time.time() - display_mode.last_switch_time)
+    if mode.enable_auto_switch:
+        time_until_switch = mode.auto_switch_interval - (now_ts - mode.last_switch_time)
         status_text = f"⌨️ Press Ctrl+C to quit • Auto-switch in {int(time_until_switch)}s • 🔄 Auto-refresh every "
     else:
         status_text = f"⌨️ Ctrl+C: quit • Enter key: 12-24hr forecast • 🔄 Auto-refresh every "
@@ -628,51 +937,114 @@ def build_layout(obs: Dict[str, Any], error: str, hourly_data: List[Dict[str, An
 # Thread-safe queue for keyboard input
 input_queue = queue.Queue()
 
-def input_thread():
-    """Thread to handle keyboard input"""
+# Set on shutdown so the input thread leaves its polling loop
+_stop = threading.Event()
+
+# Set whenever the UI loop has work: a key press or a new data snapshot
+wake = threading.Event()
+
+def queue_toggle():
+    input_queue.put('toggle')
+    wake.set()
+
+def windows_input_thread(stop):
+    """Keyboard polling for Windows, where select() does not work on stdin"""
+    import msvcrt
+
+    while not stop.is_set():
+        try:
+            if not msvcrt.kbhit():
+                time.sleep(0.1)
+                continue
+            key = msvcrt.getwch()
+            if key == '\r':
+                queue_toggle()
+            elif key in ('\x00', '\xe0'):  # Arrow key prefix
+                if msvcrt.getwch() in ('K', 'M'):  # Left / Right arrow
+                    queue_toggle()
+        except:
+            break
+
+def parse_keys(buf: str) -> str:
+    """Queue a toggle for each Enter or left/right arrow in buf.
+    Returns an incomplete trailing escape sequence to prepend to the next read."""
+    i = 0
+    while i < len(buf):
+        key = buf[i]
+        if key in '\r\n':  # Enter key (both \r and \n)
+            queue_toggle()
+            i += 1
+        elif key == '\x1b':  # ESC sequence start
+            seq = buf[i:i + 3]
+            if len(seq) < 3 and '\x1b['.startswith(seq):
+                return buf[i:]  # Wait for the rest of the sequence
+            if seq in ('\x1b[D', '\x1b[C'):  # Left / Right arrow
+                queue_toggle()
+                i += 3
+            else:
+                i += 1
+        else:
+            i += 1  # All other keys are ignored
+    return ""
+
+def input_thread(stop):
+    """Thread to handle keyboard input until stop is set"""
+    if sys.platform == "win32":
+        return windows_input_thread(stop)
+
+    import os
     import select
 
-    while True:
+    fd = sys.stdin.fileno()
+    pending = ""
+    while not stop.is_set():
         try:
-            # Check if input available
-            if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                key = sys.stdin.read(1)
-
-                # Check for Enter key specifically (both \r and \n)
-                if key in ['\r', '\n']:
-                    input_queue.put('toggle')
-                    continue  # Skip further checks for this key press
-
-                # Check for arrow keys (escape sequences)
-                if key == '\x1b':  # ESC sequence start
-                    # Read the rest of the sequence
-                    if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                        seq1 = sys.stdin.read(1)
-                        if seq1 == '[':
-                            if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                                seq2 = sys.stdin.read(1)
-                                if seq2 == 'D':  # Left arrow
-                                    input_queue.put('toggle')
-                                elif seq2 == 'C':  # Right arrow
-                                    input_queue.put('toggle')
-                # All other keys are ignored - only Enter works now
+            # Block until input arrives; the timeout only bounds how long shutdown takes
+            if not select.select([fd], [], [], 1.0)[0]:
+                continue
+            data = os.read(fd, 16)
+            if not data:
+                break  # stdin closed
+            pending = parse_keys(pending + data.decode("latin-1"))
         except:
             break
 
 # Start input thread
-threading.Thread(target=input_thread, daemon=True).start()
+threading.Thread(target=input_thread, args=(_stop,), daemon=True).start()
 
 def check_for_forecast_key():
     """Check for 'n' key press to toggle forecast mode"""
-    try:
-        while not input_queue.empty():
+    while True:
+        try:
             command = input_queue.get_nowait()
-            if command == 'toggle':
-                display_mode.toggle_forecast()
-                return True
-    except:
-        pass
-    return False
+        except queue.Empty:
+            return False
+        if command == 'toggle':
+            display_mode.toggle_forecast()
+            return True
+
+# --- Background Fetcher ---
+
+# Holds only the latest data snapshot; the UI loop drains it without blocking
+_data_queue = queue.Queue(maxsize=1)
+
+def fetcher_thread():
+    """Thread to poll each endpoint on its own schedule"""
+    published = data_snapshot()
+    while True:
+        time.sleep(max(0.0, min(ep.next_fetch_at for ep in _endpoints) - time.monotonic()))
+        if not refresh_due():
+            continue
+        snapshot = data_snapshot()
+        if snapshot == published:
+            continue  # Same payload objects and errors: nothing for the UI to redraw
+        published = snapshot
+        try:
+            _data_queue.get_nowait()  # Drop a snapshot the UI never picked up
+        except queue.Empty:
+            pass
+        _data_queue.put_nowait(snapshot)
+        wake.set()
 
 # --- Main Execution ---
 
@@ -682,14 +1054,17 @@ def main() -> None:
     aq, last_aq_err = {}, ""
 
     with console.status("[bold green]Fetching data..."):
-        obs, last_err = fetch_observation()
-        hourly_data, last_hourly_err = fetch_hourly_forecast()
-        aq, last_aq_err = fetch_air_quality()
+        refresh_due()
+        (obs, last_err), (hourly_data, last_hourly_err), (aq, last_aq_err) = data_snapshot()
+
+    layout = build_layout(display_mode.snapshot(), obs, last_err or last_hourly_err or last_aq_err, hourly_data, console, aq)
 
-    layout = build_layout(obs, last_err or last_hourly_err or last_aq_err, hourly_data, console, aq)
+    threading.Thread(target=fetcher_thread, daemon=True).start()
 
-    with Live(layout, refresh_per_second=4, screen=True, console=console) as live:
-        last_update_time = time.time()
+    # The loop below redraws explicitly (at least once per clock second), so Live
+    # needs no refresh thread of its own re-rendering an unchanged screen
+    with Live(layout, auto_refresh=False, screen=True, console=console) as live:
+        dirty, last_sec = True, int(time.time())
         while True:
             # Check for 'n' key press
             try:
@@ -697,33 +1072,35 @@ def main() -> None:
             except:
                 pass
 
-            # Always update layout to reflect any mode changes immediately
-            new_layout = build_layout(obs, last_err or last_hourly_err or last_aq_err, hourly_data, console, aq)
-            live.update(new_layout)
-
-            # Refresh data when mode changes or in normal mode after timeout
-            current_time = time.time()
-            should_refresh = False
+            # Swap in fresh data if the fetcher thread published any
+            try:
+                (obs, last_err), (hourly_data, last_hourly_err), (aq, last_aq_err) = _data_queue.get_nowait()
+                dirty = True
+            except queue.Empty:
+                pass
 
-            # Force refresh when mode changes
-            if display_mode.has_mode_changed():
-                should_refresh = True
-                last_update_time = current_time  # Reset timer
+            # One lock acquisition per tick for all display mode state
+            mode = display_mode.snapshot()
+            if mode.mode_changed:
+                dirty = True
 
-            # Regular refresh in normal mode
-            elif not display_mode.is_full_forecast() and current_time - last_update_time >= REFRESH_SECONDS:
-                should_refresh = True
-                last_update_time = current_time
+            # The header clock still needs a redraw once per second
+            now_sec = int(time.time())
+            if now_sec != last_sec:
+                dirty, last_sec = True, now_sec
 
-            if should_refresh:
-                obs, last_err = fetch_observation()
-                hourly_data, last_hourly_err = fetch_hourly_forecast()
-                aq, last_aq_err = fetch_air_quality()
+            # Only rebuild the layout when something visible changed
+            if dirty:
+                new_layout = build_layout(mode, obs, last_err or last_hourly_err or last_aq_err, hourly_data, console, aq)
+                live.update(new_layout, refresh=True)
+                dirty = False
 
-            time.sleep(0.25)  # Short sleep for responsive UI
+            # Sleep until woken by input/data, or until the next clock second
+            wake.wait(timeout=1 - time.time() % 1)
+            wake.clear()
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        pass
+        _stop.set()
@@ -1,10 +1,14 @@
-import json
 from textwrap import wrap
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -23,19 +27,20 @@ API_URL = (
     f"{OPENWEATHER_API_KEY}"
 )
 
+HEADERS = {
+    "User-Agent": "rich-weather/1.0",
+    "Accept": "application/json",
+}
+REQUEST = Request(API_URL, headers=HEADERS)
+
 def fetch_weather_data() -> Tuple[Dict[str, Any], str]:
     """Fetches weather data from the OpenWeatherMap API."""
-    headers = {
-        "User-Agent": "rich-weather/1.0",
-        "Accept": "application/json",
-    }
-    req = Request(API_URL, headers=headers)
     try:
-        with urlopen(req, timeout=10) as resp:
+        with urlopen(REQUEST, timeout=10) as resp:
             if resp.status != 200:
                 return {}, f"HTTP Error {resp.status}"
             raw = resp.read()
-            data = json.loads(raw.decode("utf-8"))
+            data = _json.loads(raw)
             return data, ""
     except HTTPError as e:
         return {}, f"HTTPError {e.code}: {e.reason}"
@@ -44,23 +49,20 @@ def fetch_weather_data() -> Tuple[Dict[str, Any], str]:
     except Exception as e:
         return {}, f"An unexpected error occurred: {e}"
 
+# OpenWeatherMap icon codes are a closed set: condition number + d(ay)/n(ight)
+WEATHER_EMOJI = {
+    "01d": "☀️", "01n": "🌙",                  # Clear sky
+    "02d": "🌤️", "02n": "☁️",                  # Few clouds
+    "03d": "☁️", "03n": "☁️", "04d": "☁️", "04n": "☁️",  # Scattered/Broken clouds
+    "09d": "🌧️", "09n": "🌧️", "10d": "🌧️", "10n": "🌧️",  # Rain
+    "11d": "⛈️", "11n": "⛈️",                  # Thunderstorm
+    "13d": "❄️", "13n": "❄️",                  # Snow
+    "50d": "🌫️", "50n": "🌫️",                  # Mist
+}
+
 def get_weather_emoji(icon_code: str) -> str:
     """Maps OpenWeatherMap icon codes to emojis."""
-    if "01" in icon_code:  # Clear sky
-        return "☀️" if "d" in icon_code else "🌙"
-    elif "02" in icon_code:  # Few clouds
-        return "🌤️" if "d" in icon_code else "☁️"
-    elif "03" in icon_code or "04" in icon_code:  # Scattered/Broken clouds
-        return "☁️"
-    elif "09" in icon_code or "10" in icon_code:  # Rain
-        return "🌧️"
-    elif "11" in icon_code:  # Thunderstorm
-        return "⛈️"
-    elif "13" in icon_code:  # Snow
-        return "❄️"
-    elif "50" in icon_code:  # Mist
-        return "🌫️"
-    return "❓"
+    return WEATHER_EMOJI.get(icon_code, "❓")
 
 
 def create_hourly_forecast_panels(hourly_data: List[Dict[str, Any]]) -> Columns:
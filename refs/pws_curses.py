@@ -1,10 +1,14 @@
 import curses
-import json
 import locale
 import time
 from typing import Any, Dict, List, Tuple
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+import urllib3
 
 
 API_URL = (
@@ -13,31 +17,32 @@ API_URL = (
 )
 REFRESH_SECONDS = 30
 
+HEADERS = {
+    "User-Agent": "pws-curses/1.0 (+https://api.weather.com)",
+    "Accept": "application/json",
+}
+# Keep-alive pool, so refreshes reuse the TLS connection to api.weather.com. No retries:
+# the fetch blocks the curses loop, so a stalled host must cost one 10 s timeout at most
+HTTP = urllib3.PoolManager(num_pools=1, maxsize=1, headers=HEADERS, timeout=urllib3.Timeout(total=10),
+                           retries=False)
+
 
 def fetch_observation() -> Tuple[Dict[str, Any], str]:
     """
     Fetch current observation JSON and return (observation_dict, error_message).
     If successful, error_message is an empty string.
     """
-    headers = {
-        "User-Agent": "pws-curses/1.0 (+https://api.weather.com)",
-        "Accept": "application/json",
-    }
-    req = Request(API_URL, headers=headers)
     try:
-        with urlopen(req, timeout=10) as resp:
-            if resp.status != 200:
-                return {}, f"HTTP {resp.status}"
-            raw = resp.read()
-            data = json.loads(raw.decode("utf-8"))
-            observations = data.get("observations") or []
-            if not observations:
-                return {}, "No observations in response"
-            return observations[0], ""
-    except HTTPError as e:
-        return {}, f"HTTPError {e.code}: {e.reason}"
-    except URLError as e:
-        return {}, f"URLError: {getattr(e, 'reason', str(e))}"
+        resp = HTTP.request("GET", API_URL)
+        if resp.status != 200:
+            return {}, f"HTTP {resp.status}"
+        data = _json.loads(resp.data)
+        observations = data.get("observations") or []
+        if not observations:
+            return {}, "No observations in response"
+        return observations[0], ""
+    except urllib3.exceptions.HTTPError as e:
+        return {}, f"HTTPError: {e}"
     except Exception as e:  # noqa: BLE001 (keep broad to show message in UI)
         return {}, f"Error: {str(e)}"
 
@@ -1,10 +1,21 @@
-import requests
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
+import bisect
+import json
+import os
 import sys
-from datetime import datetime
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 # --- Weather Code Mapping ---
 # Map WMO weather codes from Open-Meteo to emoji and description
@@ -39,47 +50,176 @@ WEATHER_CODES = {
     99: ("⛈️", "Thunderstorm with heavy hail"),
 }
 
+# WMO codes are 0..99, so lookups index a dense per-code array of ready-made
+# "emoji description" cells instead of hashing and formatting per row
+_UNKNOWN_DESC = "❓ Unknown"
+_ROW_DESC = [_UNKNOWN_DESC] * 100
+for _code, (_emoji, _desc) in WEATHER_CODES.items():
+    _ROW_DESC[_code] = f"{_emoji} {_desc}"
+_ROW_DESC = tuple(_ROW_DESC)
+del _code, _emoji, _desc
+
+def describe_weather(code):
+    """Returns the "emoji description" table cell for a WMO weather code."""
+    if isinstance(code, int) and 0 <= code < 100:
+        return _ROW_DESC[code]
+    return _UNKNOWN_DESC
+
+# One keep-alive pool per host, shared by both lookups. requests is only imported
+# once a lookup actually misses the disk cache.
+_SESSION = None
+
+def _session():
+    """Returns the shared requests.Session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": "argard/1.0",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        })
+        # Transient failures are retried on the pooled connection with exponential backoff
+        # (honoring Retry-After); exhausted retries raise and fall back to the disk cache
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=4)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+def _warm_up(session, url):
+    """Opens (DNS + TCP + TLS) a pooled connection to url's host; failures are ignored."""
+    try:
+        session.head(url, timeout=5)
+    except Exception:
+        pass
+
+# --- Response Cache ---
+# Responses kept between runs as {key: {"ts": epoch seconds, "data": ...}}
+CACHE_FILE = Path.home() / ".cache" / "argard" / "forecast.json"
+LOCATION_TTL = 600   # IP geolocation rarely changes
+FORECAST_TTL = 900   # Open-Meteo updates its models far less often than this
+STALE_MAX_AGE = 6 * 3600  # Offline fallback limit; the 12-hour window is half gone by then
+
+_CACHE = None  # The cache file's contents, read at most once per run
+
+def _load_cache():
+    global _CACHE
+    if _CACHE is None:
+        try:
+            _CACHE = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _CACHE = {}
+        if not isinstance(_CACHE, dict):
+            _CACHE = {}  # Not written by us; start over
+    return _CACHE
+
+def _cache_entry(key, max_age):
+    """Return the cache entry for key if well-formed and younger than max_age seconds."""
+    entry = _load_cache().get(key)
+    if not (isinstance(entry, dict) and "data" in entry and isinstance(entry.get("ts"), (int, float))):
+        return None  # Missing or malformed entries are misses
+    return entry if 0 <= time.time() - entry["ts"] < max_age else None  # Rejects future/inf stamps
+
+def _cache_get(key, ttl):
+    """Return the cached data for key if younger than ttl seconds."""
+    entry = _cache_entry(key, ttl)
+    return entry["data"] if entry else None
+
+def _cache_stale(key):
+    """Return the cached data for key after a failed fetch, unless older than STALE_MAX_AGE."""
+    entry = _cache_entry(key, STALE_MAX_AGE)
+    if entry:
+        saved = time.strftime("%H:%M", time.localtime(entry["ts"]))
+        print(f"Showing cached {key.split(':')[0]} from {saved}", file=sys.stderr)
+        return entry["data"]
+    return None
+
+def _cache_put(key, value):
+    cache = _load_cache()
+    cache[key] = {"ts": time.time(), "data": value}
+    tmp = None
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CACHE_FILE.parent,
+                                         suffix=".tmp", delete=False) as tmp:
+            json.dump(cache, tmp)
+        # Atomic, so a concurrent run never reads half a file (and each run has its own temp file)
+        os.replace(tmp.name, CACHE_FILE)
+    except OSError:
+        if tmp is not None and os.path.exists(tmp.name):
+            os.unlink(tmp.name)  # Don't leave a half-written temp file behind
+        # Caching is best effort
+
 def get_location_from_ip():
     """Fetches location data (lat, lon, city) from IP address."""
+    cached = _cache_get("location", LOCATION_TTL)
+    if cached:
+        return cached
+    import requests
     try:
-        response = requests.get("http://ip-api.com/json/", timeout=10)
+        response = _session().get("http://ip-api.com/json/", timeout=10)
         response.raise_for_status()  # Raise an exception for bad status codes
-        data = response.json()
+        data = _json.loads(response.content)
         if data.get("status") == "success":
-            return {
+            location = {
                 "lat": data["lat"],
                 "lon": data["lon"],
                 "city": data.get("city", "Unknown City"),
             }
+            _cache_put("location", location)
+            return location
         else:
             return None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error getting location: {e}", file=sys.stderr)
-        return None
+        return _cache_stale("location")  # Stale location beats none when offline
 
 def get_weather_forecast(lat, lon):
     """Fetches both daily and hourly weather forecast from Open-Meteo."""
+    key = f"forecast:{round(lat, 2)},{round(lon, 2)}"
+    cached = _cache_get(key, FORECAST_TTL)
+    if cached:
+        return cached
+    import requests
     try:
-        url = "https://api.open-meteo.com/v1/forecast"
+        url = FORECAST_URL
+        # Only the hours build_hourly_forecast shows (end_hour is inclusive, so one
+        # spare covers an hour boundary passing while the response is cached)
+        now = datetime.now().replace(minute=0, second=0, microsecond=0)
         params = {
             "latitude": lat,
             "longitude": lon,
             "daily": "weather_code,temperature_2m_max,temperature_2m_min",
             "hourly": "temperature_2m,weather_code",
+            "start_hour": now.strftime("%Y-%m-%dT%H:%M"),
+            "end_hour": (now + timedelta(hours=12)).strftime("%Y-%m-%dT%H:%M"),
             "timezone": "auto",
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        data = _json.loads(response.content)
+        _cache_put(key, data)
+        return data
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error getting weather forecast: {e}", file=sys.stderr)
-        return None
+        return _cache_stale(key)  # Fall back to a stale forecast when the network is down
+
+def _current_hour_iso():
+    """Returns the current local hour in Open-Meteo's time format, e.g. "2024-05-01T13:00"."""
+    return time.strftime("%Y-%m-%dT%H:00", time.localtime())
 
-def display_hourly_forecast(console, forecast_data, city):
-    """Displays the 12-hour forecast."""
+def build_hourly_forecast(forecast_data, city):
+    """Builds the 12-hour forecast panel (or an error message)."""
     if "hourly" not in forecast_data:
-        console.print("[bold red]Could not retrieve hourly forecast.[/bold red]")
-        return
+        return Text.from_markup("[bold red]Could not retrieve hourly forecast.[/bold red]")
 
     hourly_table = Table(show_header=True, header_style="bold yellow")
     hourly_table.add_column("Time", style="dim", width=8)
@@ -87,44 +227,67 @@ def display_hourly_forecast(console, forecast_data, city):
     hourly_table.add_column("Temp (°C)", justify="right", style="bold green")
 
     hourly_data = forecast_data["hourly"]
-    now = datetime.now().replace(minute=0, second=0, microsecond=0)
-    
-    # Find the index of the current hour in the forecast data
-    try:
-        start_index = hourly_data["time"].index(now.strftime("%Y-%m-%dT%H:%M"))
-    except ValueError:
-        # If current hour not found, find the next available hour
-        for i, time_str in enumerate(hourly_data["time"]):
-            if datetime.fromisoformat(time_str) > now:
-                start_index = i
-                break
-        else:
-            start_index = 0
+    times = hourly_data["time"]
 
+    # Times are fixed-format "YYYY-MM-DDTHH:MM" strings, so string order is time order:
+    # the current hour, or else the next available one
+    start_index = bisect.bisect_left(times, _current_hour_iso())
+    if start_index == len(times):
+        start_index = 0
 
-    for i in range(start_index, min(start_index + 12, len(hourly_data["time"]))):
-        time_str = hourly_data["time"][i]
-        time_obj = datetime.fromisoformat(time_str)
-        
-        weather_code = hourly_data["weather_code"][i]
-        temp = hourly_data["temperature_2m"][i]
-
-        emoji, description = WEATHER_CODES.get(weather_code, ("❓", "Unknown"))
-        
+    end_index = start_index + 12
+    for time_str, weather_code, temp in zip(
+        times[start_index:end_index],
+        hourly_data["weather_code"][start_index:end_index],
+        hourly_data["temperature_2m"][start_index:end_index],
+    ):
         hourly_table.add_row(
-            time_obj.strftime("%H:%M"),
-            f"{emoji} {description}",
-            f"{temp:.1f}",
+            time_str[11:16],  # HH:MM
+            describe_weather(weather_code),
+            "%.1f" % temp,
         )
 
     title = Text(f"12-Hour Forecast for {city}", justify="center", style="bold yellow")
-    console.print(Panel(hourly_table, title=title, border_style="yellow"))
+    return Panel(hourly_table, title=title, border_style="yellow")
+
+
+def build_daily_forecast(forecast_data, city):
+    """Builds the 7-day forecast panel (or an error message)."""
+    if "daily" not in forecast_data:
+        return Text.from_markup("[bold red]Could not retrieve daily forecast.[/bold red]")
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Date", style="dim", width=12)
+    table.add_column("Description", width=20)
+    table.add_column("High (°C)", justify="right", style="bold red")
+    table.add_column("Low (°C)", justify="right", style="bold blue")
+
+    daily_data = forecast_data["daily"]
+    for date, weather_code, temp_max, temp_min in zip(
+        daily_data["time"],
+        daily_data["weather_code"],
+        daily_data["temperature_2m_max"],
+        daily_data["temperature_2m_min"],
+    ):
+        table.add_row(
+            date,
+            describe_weather(weather_code),
+            "%.1f" % temp_max,
+            "%.1f" % temp_min,
+        )
+
+    title = Text(f"7-Day Weather Forecast for {city}", justify="center", style="bold cyan")
+    return Panel(table, title=title, border_style="green")
 
 
 def main():
     """Main function to run the weather forecast display."""
     console = Console()
 
+    # While ip-api is queried, open the Open-Meteo connection the forecast will reuse
+    if _cache_get("location", LOCATION_TTL) is None:
+        threading.Thread(target=_warm_up, args=(_session(), FORECAST_URL), daemon=True).start()
+
     with console.status("[bold green]Fetching location data..."):
         location = get_location_from_ip()
 
@@ -140,39 +303,12 @@ def main():
         console.print("[bold red]Could not retrieve weather forecast.[/bold red]")
         return
 
-    # Display Hourly Forecast
-    display_hourly_forecast(console, forecast_data, city)
-
-    # Display Daily Forecast
-    if "daily" not in forecast_data:
-        console.print("[bold red]Could not retrieve daily forecast.[/bold red]")
-        return
-        
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Date", style="dim", width=12)
-    table.add_column("Description", width=20)
-    table.add_column("High (°C)", justify="right", style="bold red")
-    table.add_column("Low (°C)", justify="right", style="bold blue")
-
-    daily_data = forecast_data["daily"]
-    for i in range(len(daily_data["time"])):
-        date = daily_data["time"][i]
-        weather_code = daily_data["weather_code"][i]
-        temp_max = daily_data["temperature_2m_max"][i]
-        temp_min = daily_data["temperature_2m_min"][i]
-
-        emoji, description = WEATHER_CODES.get(weather_code, ("❓", "Unknown"))
-        
-        table.add_row(
-            date,
-            f"{emoji} {description}",
-            f"{temp_max:.1f}",
-            f"{temp_min:.1f}",
-        )
-
-    title = Text(f"7-Day Weather Forecast for {city}", justify="center", style="bold cyan")
-    console.print(Panel(table, title=title, border_style="green"))
+    # Hourly then daily forecast, laid out and written in a single print
+    console.print(Group(
+        build_hourly_forecast(forecast_data, city),
+        build_daily_forecast(forecast_data, city),
+    ))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()